@@ -0,0 +1,142 @@
+"""
+Benchmark de arranque del backend.
+
+Mide con ``python -X importtime`` el coste de import de los módulos que carga
+cada proceso (manage.py, migraciones, workers) y la latencia de la primera
+generación con y sin warm-up del pool de YoutubeDL.
+
+Uso (desde backend/):
+
+    python benchmarks/startup.py
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# módulos pesados que no deberían cargarse al arrancar
+HEAVY_MODULES = ('yt_dlp', 'groq')
+
+# escenarios de import: lo que importa cada tipo de proceso
+SCENARIOS = {
+    'settings + apps (manage.py)': 'import django; django.setup()',
+    'urls + views (worker)': 'import django; django.setup(); import core.urls',
+    'services.warm_up (worker con warm-up)': (
+        'import django; django.setup(); '
+        'from blog_generator.services import ydl_pool, get_groq_client; '
+        'ydl_pool.warm_up(1); get_groq_client()'
+    ),
+}
+
+
+def _env(**extra):
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+    env.setdefault('SECRET_KEY', 'benchmark')
+    env.setdefault('GROQ_API_KEY', 'benchmark')
+    env.update(extra)
+    return env
+
+
+def _run(args, env):
+    # ejecuta un proceso python limpio; si falla, informa del error real
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        lines = [
+            line for line in result.stderr.strip().splitlines()
+            if not line.startswith('import time:')
+        ]
+        raise RuntimeError(lines[-1] if lines else f"exit code {result.returncode}")
+    return result
+
+
+def import_times(code):
+    # ejecuta el código en un proceso limpio y parsea la salida de -X importtime
+    result = _run(['-X', 'importtime', '-c', code], _env())
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        # solo imports de primer nivel (la anidación se indica con sangría)
+        name = name[1:]
+        if not name.startswith(' '):
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+# primera petición de generación en un worker recién arrancado: recorre
+# extract_transcript y generate_content reales, con la red sustituida por
+# respuestas fijas (extract_info y la llamada al modelo)
+FIRST_REQUEST = """
+import time
+from types import SimpleNamespace
+
+import django
+django.setup()
+
+from blog_generator import services
+
+_create = services.YoutubeDLPool._create
+def _create_offline(self):
+    ydl = _create(self)
+    ydl.extract_info = lambda url, download=True: {
+        'id': 'benchmark', 'title': 'Benchmark', 'description': 'benchmark',
+    }
+    return ydl
+services.YoutubeDLPool._create = _create_offline
+
+_get_groq_client = services.get_groq_client
+def _get_groq_client_offline():
+    client = _get_groq_client()
+    message = SimpleNamespace(content='# Benchmark')
+    client.chat.completions.create = lambda **kwargs: SimpleNamespace(
+        choices=[SimpleNamespace(message=message)],
+    )
+    return client
+services.get_groq_client = _get_groq_client_offline
+
+services.warm_up()
+
+start = time.perf_counter()
+title, transcript = services.extract_transcript('https://www.youtube.com/watch?v=benchmark')
+services.generate_content(transcript)
+print(time.perf_counter() - start)
+"""
+
+
+def first_request_latency(warm):
+    env = _env(GENERATION_WARMUP='True' if warm else 'False')
+    result = _run(['-c', FIRST_REQUEST], env)
+    return float(result.stdout.strip())
+
+
+def main():
+    print('== Import time (-X importtime) ==')
+    for label, code in SCENARIOS.items():
+        start = time.perf_counter()
+        cumulative = import_times(code)
+        wall = time.perf_counter() - start
+        total_ms = sum(cumulative.values()) / 1000
+        heavy = ', '.join(
+            f"{name}={cumulative[name] / 1000:.1f}ms" if name in cumulative else f"{name}=no cargado"
+            for name in HEAVY_MODULES
+        )
+        print(f"{label:40} imports={total_ms:8.1f}ms  proceso={wall * 1000:8.1f}ms  {heavy}")
+
+    print()
+    print('== Latencia de la primera petición ==')
+    for warm in (False, True):
+        label = 'con warm-up' if warm else 'en frío'
+        print(f"{label:40} {first_request_latency(warm) * 1000:8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
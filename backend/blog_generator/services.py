@@ -0,0 +1,189 @@
+import os
+import glob
+import queue
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# yt_dlp y groq son dependencias pesadas: se importan bajo demanda para que
+# manage.py, migraciones y arranques de workers no paguen su coste de import.
+
+MODEL_NAME = "llama-3.3-70b-versatile"
+
+# validación de longitud para proteger la ia
+MAX_CHARS = 100000
+
+YDL_OPTS = {
+    'quiet': True, 'no_warnings': True, 'skip_download': True,
+    'writesubtitles': True, 'writeautomaticsub': True,
+    'sublangs': ['es', 'en'], 'outtmpl': '%(id)s',
+}
+
+# texto idéntico al prompt original (sangría y espacios incluidos)
+PROMPT_SYSTEM = """
+        You are an expert technical blog writer. 
+        Your goal is to convert a raw YouTube video transcript into a polished, engaging, and SEO-optimized blog post in Markdown.
+        
+        Rules:
+        1. Title: Create a catchy H1 title at the very top.
+        2. Structure: Use H2 for main sections and H3 for subsections.
+        3. Content: Synthesize the transcript. Remove filler words. Make it readable.
+        4. Tone: Professional, informative, yet accessible.
+        5. Formatting: STRICTLY use Markdown (bold, lists, code blocks).
+        6. Language: If the transcript is in Spanish, write in Spanish. If English, write in English.
+        """
+
+
+# ==============================================================================
+# 1. CLIENTE DE GROQ (PEREZOSO)
+# ==============================================================================
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_groq_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from groq import Groq
+                _client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    return _client
+
+
+# ==============================================================================
+# 2. POOL DE EXTRACTORES (YoutubeDL)
+# ==============================================================================
+
+# pool de instancias YoutubeDL reutilizables; cada instancia la usa un solo
+# hilo a la vez porque YoutubeDL no es thread-safe.
+#
+# entre peticiones se conserva a propósito lo caro de crear: las clases de
+# extractores cargadas y sus instancias. lo que pertenece a una petición
+# (cookies recibidas) se borra al devolver la instancia, y una instancia cuya
+# extracción falló se cierra y se descarta en lugar de volver al pool.
+# max_size < 1 desactiva el pool: cada instancia se cierra tras usarse.
+class YoutubeDLPool:
+    def __init__(self, max_size):
+        self.max_size = max(max_size, 0)
+        # LifoQueue(maxsize=0) sería ilimitada, por eso el mínimo es 1
+        self._idle = queue.LifoQueue(maxsize=max(self.max_size, 1))
+
+    def _create(self):
+        import yt_dlp
+        return yt_dlp.YoutubeDL(dict(YDL_OPTS))
+
+    def _reset(self, ydl):
+        # limpia el estado propio de la petición antes de reutilizar
+        ydl.cookiejar.clear()
+
+    def _release(self, ydl):
+        if self.max_size < 1:
+            ydl.close()
+            return
+        try:
+            self._idle.put_nowait(ydl)
+        except queue.Full:
+            ydl.close()
+
+    def clear(self):
+        # descarta las instancias ociosas sin cerrarlas (ver _after_fork)
+        self._idle = queue.LifoQueue(maxsize=max(self.max_size, 1))
+
+    def warm_up(self, size=None):
+        # pre-inicializa instancias hasta llenar el pool
+        size = self.max_size if size is None else min(size, self.max_size)
+        while self._idle.qsize() < size:
+            try:
+                self._idle.put_nowait(self._create())
+            except queue.Full:
+                break
+
+    @contextmanager
+    def acquire(self):
+        try:
+            ydl = self._idle.get_nowait()
+        except queue.Empty:
+            ydl = self._create()
+        try:
+            yield ydl
+        except BaseException:
+            ydl.close()
+            raise
+        try:
+            self._reset(ydl)
+        except Exception:
+            ydl.close()
+            raise
+        self._release(ydl)
+
+
+ydl_pool = YoutubeDLPool(max_size=settings.GENERATION_YDL_POOL_SIZE)
+
+
+def _after_fork():
+    # un proceso hijo no debe compartir las sesiones http del padre: se
+    # descartan el pool y el cliente heredados (p. ej. gunicorn --preload)
+    global _client
+    _client = None
+    ydl_pool.clear()
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def warm_up():
+    # hook opcional: solo se ejecuta en procesos que sirven peticiones
+    # (wsgi/asgi) y si GENERATION_WARMUP está activado. con gunicorn --preload
+    # el import ocurre en el master antes del fork, así que el warm-up se
+    # pierde en los workers; el preload no está soportado para el warm-up
+    if settings.GENERATION_WARMUP:
+        ydl_pool.warm_up()
+        get_groq_client()
+
+
+# ==============================================================================
+# 3. PIPELINE DE GENERACIÓN
+# ==============================================================================
+
+def extract_transcript(yt_url):
+    # devuelve (titulo, transcripcion) del video
+    with ydl_pool.acquire() as ydl:
+        info = ydl.extract_info(yt_url, download=True)
+    video_id = info.get('id')
+    video_title = info.get('title', 'Untitled')
+
+    # buscar archivos de subtítulos generados
+    generated_files = glob.glob(f"{video_id}*.vtt")
+    if not generated_files:
+        # fallback a la descripción si no hay subtítulos
+        return video_title, info.get('description', '')
+
+    subtitle_file = generated_files[0]
+    with open(subtitle_file, 'r', encoding='utf-8') as f:
+        clean_lines = []
+        seen_lines = set()
+        for line in f:
+            # limpieza básica de formato vtt
+            if '-->' in line or line.strip() == '' or 'WEBVTT' in line or '<' in line: continue
+            text_line = line.strip()
+            if text_line not in seen_lines:
+                clean_lines.append(text_line)
+                seen_lines.add(text_line)
+    os.remove(subtitle_file)
+    return video_title, " ".join(clean_lines)
+
+
+def generate_content(transcript_text):
+    completion = get_groq_client().chat.completions.create(
+        model=MODEL_NAME,
+        messages=[
+            {"role": "system", "content": PROMPT_SYSTEM},
+            {"role": "user", "content": f"Transcript:\n{transcript_text}"}
+        ],
+        temperature=0.7,
+        max_tokens=4000,
+    )
+    return completion.choices[0].message.content
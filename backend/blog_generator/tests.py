@@ -1,3 +1,128 @@
-from django.test import TestCase
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from . import services
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+# instancia falsa de YoutubeDL para no depender de yt_dlp ni de la red
+class FakeYoutubeDL:
+    def __init__(self):
+        self.closed = False
+        self.cookiejar = mock.Mock()
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(max_size):
+    pool = services.YoutubeDLPool(max_size=max_size)
+    pool._create = FakeYoutubeDL
+    return pool
+
+
+# ==============================================================================
+# 1. IMPORTS PEREZOSOS
+# ==============================================================================
+
+class LazyImportTests(SimpleTestCase):
+    def test_urls_and_views_do_not_import_heavy_modules(self):
+        # proceso limpio: en este proceso otros tests pueden haberlos cargado
+        code = (
+            'import sys, django; django.setup(); '
+            'import core.urls, blog_generator.views; '
+            'print(",".join(m for m in ("yt_dlp", "groq") if m in sys.modules))'
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='core.settings', SECRET_KEY='test')
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '')
+
+
+# ==============================================================================
+# 2. POOL DE EXTRACTORES
+# ==============================================================================
+
+class YoutubeDLPoolTests(SimpleTestCase):
+    def test_reuses_instances_in_lifo_order(self):
+        pool = make_pool(max_size=2)
+        with pool.acquire() as first, pool.acquire() as second:
+            pass
+        # second se devolvió después, así que es el primero en salir
+        with pool.acquire() as ydl:
+            self.assertIs(ydl, first)
+        with pool.acquire() as ydl:
+            self.assertIs(ydl, first)
+        with pool.acquire() as a, pool.acquire() as b:
+            self.assertIs(a, first)
+            self.assertIs(b, second)
+
+    def test_clears_cookies_on_release(self):
+        pool = make_pool(max_size=1)
+        with pool.acquire() as ydl:
+            pass
+        ydl.cookiejar.clear.assert_called_once_with()
+        self.assertFalse(ydl.closed)
+
+    def test_closes_instances_beyond_max_size(self):
+        pool = make_pool(max_size=1)
+        with pool.acquire() as first, pool.acquire() as second:
+            pass
+        self.assertFalse(second.closed)
+        self.assertTrue(first.closed)
+
+    def test_drops_instance_after_exception(self):
+        pool = make_pool(max_size=1)
+        with self.assertRaises(RuntimeError):
+            with pool.acquire() as failed:
+                raise RuntimeError('extraction failed')
+        self.assertTrue(failed.closed)
+        with pool.acquire() as ydl:
+            self.assertIsNot(ydl, failed)
+
+    def test_zero_size_disables_pooling(self):
+        pool = make_pool(max_size=0)
+        with pool.acquire() as first:
+            pass
+        self.assertTrue(first.closed)
+        with pool.acquire() as ydl:
+            self.assertIsNot(ydl, first)
+
+    def test_warm_up_fills_only_up_to_max_size(self):
+        pool = make_pool(max_size=2)
+        pool.warm_up(5)
+        self.assertEqual(pool._idle.qsize(), 2)
+        pool = make_pool(max_size=3)
+        pool.warm_up(1)
+        self.assertEqual(pool._idle.qsize(), 1)
+
+
+# ==============================================================================
+# 3. HOOK DE WARM-UP
+# ==============================================================================
+
+class WarmUpTests(SimpleTestCase):
+    @override_settings(GENERATION_WARMUP=False)
+    def test_does_nothing_when_disabled(self):
+        with mock.patch.object(services.ydl_pool, 'warm_up') as pool_warm_up, \
+                mock.patch.object(services, 'get_groq_client') as get_client:
+            services.warm_up()
+        pool_warm_up.assert_not_called()
+        get_client.assert_not_called()
+
+    @override_settings(GENERATION_WARMUP=True)
+    def test_warms_pool_and_client_when_enabled(self):
+        with mock.patch.object(services.ydl_pool, 'warm_up') as pool_warm_up, \
+                mock.patch.object(services, 'get_groq_client') as get_client:
+            services.warm_up()
+        pool_warm_up.assert_called_once_with()
+        get_client.assert_called_once_with()
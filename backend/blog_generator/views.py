@@ -1,9 +1,3 @@
-import os
-import glob
-import dotenv
-import yt_dlp
-from groq import Groq
-
 from django.contrib.auth.models import User
 from rest_framework import status, generics
 from rest_framework.decorators import api_view, permission_classes
@@ -11,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from . import services
 from .models import BlogPost
 from .serializers import (
     ChangePasswordSerializer, 
@@ -19,11 +14,6 @@ from .serializers import (
     UserSerializer
 )
 
-# cargar variables de entorno
-dotenv.load_dotenv()
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-client = Groq(api_key=GROQ_API_KEY)
-
 
 # ==============================================================================
 # 1. AUTENTICACIÓN Y USUARIOS
@@ -140,48 +130,13 @@ def generate_blog_topic(request):
     print(f" Usuario {request.user.email} procesando: {yt_url}")
 
     # --- fase 1: extracción con yt-dlp ---
-    ydl_opts = {
-        'quiet': True, 'no_warnings': True, 'skip_download': True,
-        'writesubtitles': True, 'writeautomaticsub': True,
-        'sublangs': ['es', 'en'], 'outtmpl': '%(id)s',
-    }
-    
-    transcript_text = ""
-    video_title = "Untitled"
-    
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(yt_url, download=True)
-            video_id = info.get('id')
-            video_title = info.get('title', 'Untitled')
-
-        # buscar archivos de subtítulos generados
-        generated_files = glob.glob(f"{video_id}*.vtt")
-        if generated_files:
-            subtitle_file = generated_files[0]
-            with open(subtitle_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                clean_lines = []
-                seen_lines = set()
-                for line in lines:
-                    # limpieza básica de formato vtt
-                    if '-->' in line or line.strip() == '' or 'WEBVTT' in line or '<' in line: continue
-                    text_line = line.strip()
-                    if text_line not in seen_lines:
-                        clean_lines.append(text_line)
-                        seen_lines.add(text_line)
-                transcript_text = " ".join(clean_lines)
-            os.remove(subtitle_file)
-        else:
-            # fallback a la descripción si no hay subtítulos
-            transcript_text = info.get('description', '')
-
+        video_title, transcript_text = services.extract_transcript(yt_url)
     except Exception as e:
         return Response({'error': f"Error extracting video: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # validación de longitud para proteger la ia
-    MAX_CHARS = 100000
-    if len(transcript_text) > MAX_CHARS:
+    if len(transcript_text) > services.MAX_CHARS:
         return Response(
             {'error': 'The video is too long to process (Limit exceeded). Please try a video shorter than 30 minutes.'},
             status=status.HTTP_400_BAD_REQUEST
@@ -190,34 +145,7 @@ def generate_blog_topic(request):
     # --- fase 2: inteligencia artificial (groq) ---
     try:
         print(" Enviando a Groq (LPU Inference)...")
-        
-        MODEL_NAME = "llama-3.3-70b-versatile"
-
-        prompt_system = """
-        You are an expert technical blog writer. 
-        Your goal is to convert a raw YouTube video transcript into a polished, engaging, and SEO-optimized blog post in Markdown.
-        
-        Rules:
-        1. Title: Create a catchy H1 title at the very top.
-        2. Structure: Use H2 for main sections and H3 for subsections.
-        3. Content: Synthesize the transcript. Remove filler words. Make it readable.
-        4. Tone: Professional, informative, yet accessible.
-        5. Formatting: STRICTLY use Markdown (bold, lists, code blocks).
-        6. Language: If the transcript is in Spanish, write in Spanish. If English, write in English.
-        """
-        
-        completion = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": prompt_system},
-                {"role": "user", "content": f"Transcript:\n{transcript_text}"}
-            ],
-            temperature=0.7,
-            max_tokens=4000,
-        )
-        
-        ai_generated_content = completion.choices[0].message.content
-
+        ai_generated_content = services.generate_content(transcript_text)
     except Exception as e:
         print(f"Error Groq: {e}")
         return Response(
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# warm-up opcional del pool de extractores (ver GENERATION_WARMUP)
+from blog_generator.services import warm_up  # noqa: E402
+
+warm_up()
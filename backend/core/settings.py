@@ -20,8 +20,6 @@ from dotenv import load_dotenv
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 dotenv_path = BASE_DIR.parent / '.env'
-#imprimir ruta de dotenv_path
-print(f"Loading environment variables from: {dotenv_path}")
 load_dotenv(dotenv_path)
 
 # Quick-start development settings - unsuitable for production
@@ -160,8 +158,13 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:5173",
 ]
 
-from datetime import timedelta
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1), # El token dura 1 día (para no loguearte a cada rato en desarrollo)
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
-}
\ No newline at end of file
+}
+
+# GENERACIÓN DE CONTENIDO
+# pre-calienta el pool de YoutubeDL y el cliente de Groq al arrancar los
+# workers wsgi/asgi (nunca en manage.py migrate ni otros comandos)
+GENERATION_WARMUP = os.getenv('GENERATION_WARMUP') == 'True'
+GENERATION_YDL_POOL_SIZE = int(os.getenv('GENERATION_YDL_POOL_SIZE', '4'))